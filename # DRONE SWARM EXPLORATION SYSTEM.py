@@ -6,16 +6,22 @@ import numpy as np
 import time
 import math
 import random
-from PIL import Image, ImageDraw
+from PIL import Image
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from PIL import ImageTk
-import io
 from datetime import datetime
 import threading
-import queue
+import collections
+from dataclasses import dataclass
 import logging
-from scipy.spatial import Voronoi, distance
+from scipy.spatial import cKDTree
+
+try:
+    import sim_kernels
+    USE_NUMBA = sim_kernels.NUMBA_AVAILABLE
+except ImportError:
+    USE_NUMBA = False
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +33,13 @@ logging.basicConfig(
     ]
 )
 
+# Drone status codes: int8 values stored in the simulation's SoA state
+# so status checks can be masked vectorized alongside the physics arrays
+STATUS_EXPLORING, STATUS_HALTED, STATUS_MANUAL, STATUS_DEAD = range(4)
+STATUS_NAMES = ('exploring', 'halted', 'manual', 'dead')
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+
 class Config:
     # Environment settings
     ENV_SIZE = 50
@@ -83,129 +96,204 @@ class Environment:
                 self.grid[y, x] = 1
             attempts += 1
         
+        self.targets_arr = np.asarray(self.targets, dtype=np.float32)
+        self._target_tree = cKDTree(self.targets_arr)
+
+        # Precomputed disk masks for raster rendering: fill plus a 1px
+        # outline ring, stamped directly into the frame array.
+        yy, xx = np.ogrid[-5:6, -5:6]
+        d2 = xx * xx + yy * yy
+        self._target_fill = d2 <= 16
+        self._target_ring = (d2 > 16) & (d2 <= 25)
+        yy, xx = np.ogrid[-3:4, -3:4]
+        d2 = xx * xx + yy * yy
+        self._drone_fill = d2 <= 4
+        self._drone_ring = (d2 > 4) & (d2 <= 9)
+
+        # Cached static background, invalidated when explored grows
+        self._bg_cache = None
+        self._bg_explored_size = -1
+
         logging.info(f"Environment created: {self.size}x{self.size} with {len(self.targets)} targets")
 
+    def detect_batch(self, xs, ys, r):
+        # Detection test for all drones at once: a single KD-tree query
+        # (targets never move, so the tree is built once) returns each
+        # drone's nearest target; O((D+T)logT) instead of the dense D*T
+        # distance matrix.
+        dist, idx = self._target_tree.query(np.column_stack((xs, ys)))
+        return dist <= r, idx
+
     def getinfo(self, x, y, r):
+        # Scalar fallback path; compare squared distances so the loop
+        # needs no sqrt at all
+        r2 = r * r
         for tx, ty in self.targets:
-            distance = math.sqrt((x - tx)**2 + (y - ty)**2)
-            if distance <= r:
+            if (x - tx) ** 2 + (y - ty) ** 2 <= r2:
                 return True, (tx, ty)
         return False, None
 
-    def render(self, drones, explored_regions):
+    # Fill colors indexed by status code (exploring, halted, manual, dead)
+    DRONE_COLORS = ((0, 0, 255), (255, 165, 0), (128, 0, 128), (0, 0, 255))
+
+    @staticmethod
+    def _stamp(canvas, cx, cy, mask, color):
+        # Paste a sprite mask at (cx, cy), clipped to the canvas edges
+        r = mask.shape[0] // 2
+        h, w = canvas.shape[:2]
+        x1, y1 = cx - r, cy - r
+        cx1, cy1 = max(0, x1), max(0, y1)
+        cx2, cy2 = min(w, cx + r + 1), min(h, cy + r + 1)
+        if cx2 <= cx1 or cy2 <= cy1:
+            return
+        sub = mask[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1]
+        canvas[cy1:cy2, cx1:cx2][sub] = color
+
+    def _render_background(self, explored_regions):
+        # Static scene parts (explored cells + targets) change only when
+        # a region completes, so they are cached and rebuilt on growth
+        # instead of redrawn every frame.
         cell_size = Config.CELL_SIZE
         img_size = self.size * cell_size
-        img = Image.new('RGB', (img_size, img_size), color='white')
-        draw = ImageDraw.Draw(img)
+        bg = np.full((img_size, img_size, 3), 255, dtype=np.uint8)
 
         # Draw explored regions
-        for region in explored_regions:
-            rx, ry = region
+        for rx, ry in explored_regions:
             x1 = rx * cell_size
             y1 = ry * cell_size
-            x2 = (rx + 1) * cell_size
-            y2 = (ry + 1) * cell_size
-            draw.rectangle([x1, y1, x2, y2], fill='lightgray')
+            bg[y1:y1 + cell_size + 1, x1:x1 + cell_size + 1] = (211, 211, 211)
 
         # Draw targets
         for tx, ty in self.targets:
             x = tx * cell_size
             y = ty * cell_size
-            draw.ellipse([x-5, y-5, x+5, y+5], fill='red', outline='darkred')
+            self._stamp(bg, x, y, self._target_fill, (255, 0, 0))
+            self._stamp(bg, x, y, self._target_ring, (139, 0, 0))
+
+        return bg
+
+    def render(self, drones, explored_regions):
+        # Rasterize straight into a uint8 array: copy the cached static
+        # background and stamp only the drone sprites per frame.
+        cell_size = Config.CELL_SIZE
+        if len(explored_regions) != self._bg_explored_size:
+            self._bg_cache = self._render_background(explored_regions)
+            self._bg_explored_size = len(explored_regions)
+        canvas = self._bg_cache.copy()
 
         # Draw drones
         for drone in drones:
             x = int(drone.x * cell_size)
             y = int(drone.y * cell_size)
 
-            if drone.status == 'halted':
-                color = 'orange'
-            elif drone.status == 'manual':
-                color = 'purple'
-            else:
-                color = 'blue'
+            self._stamp(canvas, x, y, self._drone_fill, self.DRONE_COLORS[drone.status_code])
+            self._stamp(canvas, x, y, self._drone_ring, (0, 0, 0))
 
-            draw.ellipse([x-3, y-3, x+3, y+3], fill=color, outline='black')
+        return Image.fromarray(canvas)
 
-        return img
 
 
+# Flat message object for the periodic status update: cheaper to build
+# and collect than a dict holding a list of per-drone dicts, and since
+# both threads share the interpreter no serialization is involved — the
+# array copies inside drones_arr guard against races with the sim loop.
+@dataclass(slots=True)
+class StatusUpdate:
+    iteration: int
+    image_raw: tuple
+    drones_arr: tuple
+    explored_regions: int
+    total_regions: int
+    active_drones: int
+    elapsed_time: float
+
 
 # DRONE CLASS
 class Drone:
+    # Thin view over the simulation's structure-of-arrays state; scalar
+    # access goes through properties so existing call sites keep working
+    # while the hot loops operate on the arrays directly.
 
-    def __init__(self, drone_id, x, y):
+    def __init__(self, drone_id, simulation):
         self.id = drone_id
-        self.x = x
-        self.y = y
-        self.vx = 0
-        self.vy = 0
-        self.power_remaining = Config.INITIAL_POWER
-        self.status = 'exploring'
+        self.sim = simulation
         self.assigned_region = None
         self.region_explore_time = 0
         self.detection_radius = Config.DETECTION_RADIUS
         self.found_target = None
         self.low_power_warning_sent = False
 
+    @property
+    def x(self):
+        return float(self.sim.state['x'][self.id])
+
+    @x.setter
+    def x(self, value):
+        self.sim.state['x'][self.id] = value
+
+    @property
+    def y(self):
+        return float(self.sim.state['y'][self.id])
+
+    @y.setter
+    def y(self, value):
+        self.sim.state['y'][self.id] = value
+
+    @property
+    def vx(self):
+        return float(self.sim.state['vx'][self.id])
+
+    @vx.setter
+    def vx(self, value):
+        self.sim.state['vx'][self.id] = value
+
+    @property
+    def vy(self):
+        return float(self.sim.state['vy'][self.id])
+
+    @vy.setter
+    def vy(self, value):
+        self.sim.state['vy'][self.id] = value
+
+    @property
+    def power_remaining(self):
+        return float(self.sim.state['power'][self.id])
+
+    @power_remaining.setter
+    def power_remaining(self, value):
+        self.sim.state['power'][self.id] = value
+
+    @property
+    def status_code(self):
+        return int(self.sim.state['status'][self.id])
+
+    @property
+    def status(self):
+        return STATUS_NAMES[self.sim.state['status'][self.id]]
+
+    @status.setter
+    def status(self, value):
+        self.sim.state['status'][self.id] = STATUS_CODES[value]
+
     def move_to_region(self, region_x, region_y, region_size):
         center_x = region_x + region_size / 2
         center_y = region_y + region_size / 2
 
+        _sqrt = math.sqrt
         dx = center_x - self.x
         dy = center_y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
+        distance = _sqrt(dx**2 + dy**2)
 
+        # Jitter comes from the simulation's pre-sampled noise buffer
+        nx, ny = self.sim.noise[self.sim.iteration & 8191, self.id]
         if distance > 0.5:
-            self.vx = dx / distance * Config.DRONE_SPEED + random.uniform(-0.1, 0.1)
-            self.vy = dy / distance * Config.DRONE_SPEED + random.uniform(-0.1, 0.1)
+            self.vx = dx / distance * Config.DRONE_SPEED + nx
+            self.vy = dy / distance * Config.DRONE_SPEED + ny
         else:
-            # Random movement within region
-            self.vx = random.uniform(-0.3, 0.3)
-            self.vy = random.uniform(-0.3, 0.3)
+            # Random movement within region (+-0.3 amplitude)
+            self.vx = nx * 3
+            self.vy = ny * 3
     
-    def avoid_collision(self, other_drones):
-        avoidance_x = 0
-        avoidance_y = 0
-        
-        for other in other_drones:
-            if other.id == self.id:
-                continue
-            
-            dx = self.x - other.x
-            dy = self.y - other.y
-            distance = math.sqrt(dx**2 + dy**2)
-            
-            if 0 < distance < Config.MIN_DRONE_DISTANCE:
-                # Apply repulsive force
-                force = Config.AVOIDANCE_FORCE / (distance + 0.1)
-                avoidance_x += (dx / distance) * force
-                avoidance_y += (dy / distance) * force
-        
-        self.vx += avoidance_x
-        self.vy += avoidance_y
-
-    def update(self, env_size):
-        
-        if self.power_remaining > 0:
-            self.x += self.vx
-            self.y += self.vy
-            self.power_remaining -= Config.POWER_CONSUMPTION_RATE
-
-            # Keep within bounds
-            self.x = max(0, min(env_size - 1, self.x))
-            self.y = max(0, min(env_size - 1, self.y))
-            
-            # Check for low power
-            if self.power_remaining < Config.LOW_POWER_THRESHOLD and not self.low_power_warning_sent:
-                self.low_power_warning_sent = True
-                logging.warning(f"Drone {self.id} low on power: {self.power_remaining:.1f}")
-        else:
-            # Drone out of power
-            if self.status != 'dead':
-                self.status = 'dead'
-                logging.error(f"Drone {self.id} ran out of power at ({self.x:.1f}, {self.y:.1f})")
-
 
 
 # SIMULATION CLASS 
@@ -215,26 +303,57 @@ class DroneSimulation:
 
     def __init__(self):
         self.env = Environment()
-        self.drones = [Drone(i, random.uniform(0, self.env.size), random.uniform(0, self.env.size)) 
-                      for i in range(Config.NUM_DRONES)]
+
+        # Structure-of-arrays drone state: one vector op per tick replaces
+        # N Python-level scalar updates.
+        n = Config.NUM_DRONES
+        self.state = {
+            'x': np.random.uniform(0, self.env.size, n),
+            'y': np.random.uniform(0, self.env.size, n),
+            'vx': np.zeros(n),
+            'vy': np.zeros(n),
+            'power': np.full(n, float(Config.INITIAL_POWER)),
+            'status': np.zeros(n, dtype=np.int8),
+        }
+        self.drones = [Drone(i, self) for i in range(n)]
+
+        # Pre-sampled movement jitter, indexed by (iteration, drone).
+        # Replaces ~2N random.uniform calls per tick with buffer reads.
+        self.noise = np.random.uniform(-0.1, 0.1, (8192, n, 2)).astype(np.float32)
 
         self.region_size = Config.REGION_SIZE
         self.explored_regions = set()
-        self.all_regions = [(rx, ry) for rx in range(0, self.env.size, self.region_size) 
+        self.all_regions = [(rx, ry) for rx in range(0, self.env.size, self.region_size)
                            for ry in range(0, self.env.size, self.region_size)]
+
+        # Precomputed region centers for nearest-drone assignment
+        half = self.region_size / 2
+        self.region_centers = np.array(
+            [[rx + half, ry + half] for rx, ry in self.all_regions],
+            dtype=np.float32)
+        self.region_idx = {r: i for i, r in enumerate(self.all_regions)}
+
+        # Incrementally-maintained complement of explored_regions; the
+        # ordered list is only rebuilt on ticks where a region completed.
+        self.unexplored_set = set(self.all_regions)
+        self._unexplored_cache = list(self.all_regions)
+        self._unexplored_dirty = False
         self.explore_time_threshold = Config.EXPLORE_TIME_THRESHOLD
         self.iteration = 0
         self.running = True
         self.start_time = time.time()
 
         # Queues for communication
-        self.to_simulation = queue.Queue()
-        self.to_ui = queue.Queue()
+        # Single-producer/single-consumer mailboxes. Both ends drain with
+        # non-blocking loops, so a deque (append/popleft are atomic in
+        # CPython) avoids queue.Queue's Condition/Lock overhead.
+        self.to_simulation = collections.deque()
+        self.to_ui = collections.deque()
         
         # Voronoi-based exploration state
         self.voronoi_assignments = {}
         self.last_voronoi_update = -Config.VORONOI_UPDATE_INTERVAL  # Force first update
-        self.last_drone_positions = None
+        self.last_positions_xy = None  # (N, 2) snapshot at last Voronoi update
 
         logging.info(f"Simulation initialized - {Config.NUM_DRONES} drones, {len(self.env.targets)} targets")
         logging.info(f"Targets at: {self.env.targets}")
@@ -243,41 +362,33 @@ class DroneSimulation:
     def assign_regions_voronoi(self, unexplored_regions):
        
         # Get active exploring drones
-        active_drones = [d for d in self.drones 
-                        if d.power_remaining > 0 and d.status == 'exploring']
+        active_drones = [self.drones[i] for i in np.flatnonzero(self._moving_mask())]
         
         if not active_drones or not unexplored_regions:
             return {}
-        
-        # Need at least 4 points for Voronoi in 2D
-        if len(active_drones) < 4:
-            # Fall back to greedy for small number of drones
-            return self.assign_regions_greedy(active_drones, unexplored_regions)
-        
+
         try:
             # Extract drone positions
             drone_positions = np.array([[d.x, d.y] for d in active_drones])
-            
-            # Create Voronoi diagram
-            vor = Voronoi(drone_positions)
-            
-            # Assign each region to nearest drone (Voronoi cell)
-            assignments = {d.id: [] for d in active_drones}
-            
-            for region in unexplored_regions:
-                # Calculate region center
-                region_center = np.array([region[0] + self.region_size / 2, 
-                                         region[1] + self.region_size / 2])
-                
-                # Find which drone's Voronoi cell this region belongs to
-                distances = distance.cdist([region_center], drone_positions)[0]
-                closest_drone_idx = np.argmin(distances)
-                
-                drone = active_drones[closest_drone_idx]
-                assignments[drone.id].append(region)
-            
+
+            # Nearest-drone assignment *is* the Voronoi partition of the
+            # region centers; a single KD-tree query replaces the per-region
+            # cdist loop (and the unused Voronoi() construction).
+            unexplored_idx = np.array([self.region_idx[r] for r in unexplored_regions])
+            centers = self.region_centers[unexplored_idx]
+            _, nn = cKDTree(drone_positions).query(centers)
+
+            # Group region indices per drone entirely in NumPy: sort the
+            # nearest-drone labels once and split, instead of appending to
+            # per-drone Python lists. Assignment values are 1-D int arrays
+            # of indices into region_centers / all_regions.
+            order = np.argsort(nn, kind='stable')
+            splits = np.searchsorted(nn[order], np.arange(1, len(active_drones)))
+            groups = np.split(unexplored_idx[order], splits)
+            assignments = {d.id: g for d, g in zip(active_drones, groups)}
+
             # Log assignment statistics
-            non_empty = sum(1 for regions in assignments.values() if regions)
+            non_empty = sum(1 for regions in assignments.values() if len(regions))
             total_assigned = sum(len(regions) for regions in assignments.values())
             logging.debug(f"Voronoi assignment: {non_empty} drones with regions, {total_assigned} total regions")
             
@@ -287,54 +398,139 @@ class DroneSimulation:
             logging.warning(f"Voronoi assignment failed: {e}, falling back to greedy")
             return self.assign_regions_greedy(active_drones, unexplored_regions)
     
+    # Four sites far outside the environment guarantee every real drone's
+    # Voronoi cell is finite, so diagnostics never hit Qhull's slow
+    # infinite-ridge reconstruction path.
+    GHOST_POINTS = np.array([[-1e4, -1e4], [1e4, -1e4], [-1e4, 1e4], [1e4, 1e4]],
+                            dtype=np.float32)
+
+    def voronoi_diagram(self):
+        # Diagnostic/visualization helper only — region assignment itself
+        # uses the KD-tree query and never builds the diagram. Returns the
+        # Voronoi diagram of active drone positions; ignore cells for point
+        # indices >= the number of drones (those belong to ghost points).
+        from scipy.spatial import Voronoi
+
+        moving = self._moving_mask()
+        positions = np.column_stack(
+            (self.state['x'][moving], self.state['y'][moving]))
+        if len(positions) == 0:
+            return None
+        return Voronoi(np.vstack([positions, self.GHOST_POINTS]))
+
     def assign_regions_greedy(self, active_drones, unexplored_regions):
         
         assignments = {d.id: [] for d in active_drones}
         
-        # Simple partitioning: each drone gets nearby regions
+        # Simple partitioning: each drone gets its 5 nearest regions (as
+        # index arrays, matching the Voronoi path's contract). An O(R)
+        # argpartition replaces the old full sort per drone.
+        unexplored_idx = np.array([self.region_idx[r] for r in unexplored_regions],
+                                  dtype=np.intp)
+        centers = self.region_centers[unexplored_idx]
+        k = min(5, len(unexplored_idx))
         for drone in active_drones:
-            # Find regions within reasonable distance
-            nearby_regions = sorted(unexplored_regions, 
-                key=lambda r: math.sqrt((drone.x - r[0])**2 + (drone.y - r[1])**2))[:5]
-            assignments[drone.id] = nearby_regions
-        
+            d2 = (centers[:, 0] - drone.x) ** 2 + (centers[:, 1] - drone.y) ** 2
+            if k < len(d2):
+                nearest = np.argpartition(d2, k)[:k]
+            else:
+                nearest = np.arange(len(d2))
+            assignments[drone.id] = unexplored_idx[nearest]
+
         return assignments
     
+    def _moving_mask(self):
+        # Exploring drones with power are the ones that steer, move and
+        # consume power each tick
+        return ((self.state['status'] == STATUS_EXPLORING)
+                & (self.state['power'] > 0))
+
+    def _apply_avoidance(self, moving):
+        # Pairwise repulsion via broadcasting: one NxN pass replaces the
+        # old O(N^2) Python loop of scalar sqrts in Drone.avoid_collision.
+        state = self.state
+        xs, ys = state['x'], state['y']
+
+        dx = xs[:, None] - xs[None, :]
+        dy = ys[:, None] - ys[None, :]
+        d2 = dx * dx + dy * dy
+        mask = (d2 > 0) & (d2 < Config.MIN_DRONE_DISTANCE ** 2)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d = np.sqrt(d2)
+            inv = np.where(mask, Config.AVOIDANCE_FORCE / (d + 0.1) / d, 0.0)
+
+        # Only exploring, powered drones steer; everyone still repels them.
+        state['vx'][moving] += (dx * inv).sum(axis=1)[moving]
+        state['vy'][moving] += (dy * inv).sum(axis=1)[moving]
+
+    def update_physics(self, moving):
+        # Vectorized replacement for the old per-drone Drone.update loop.
+        # Only exploring drones with power move and consume power, matching
+        # the previous behaviour (halted/manual drones idle for free).
+        state = self.state
+        state['x'][moving] += state['vx'][moving]
+        state['y'][moving] += state['vy'][moving]
+        np.clip(state['x'], 0, self.env.size - 1, out=state['x'])
+        np.clip(state['y'], 0, self.env.size - 1, out=state['y'])
+        state['power'][moving] -= Config.POWER_CONSUMPTION_RATE
+
+    def step_physics(self):
+        # Avoidance + movement in one compiled kernel when numba is
+        # available; otherwise the vectorized NumPy path.
+        moving = self._moving_mask()
+        state = self.state
+        if USE_NUMBA:
+            sim_kernels.step(state['x'], state['y'], state['vx'], state['vy'],
+                             state['power'], moving, float(self.env.size),
+                             Config.MIN_DRONE_DISTANCE, Config.AVOIDANCE_FORCE,
+                             Config.POWER_CONSUMPTION_RATE)
+        else:
+            self._apply_avoidance(moving)
+            self.update_physics(moving)
+
+        # Status transitions are rare, so they stay scalar
+        for drone_id in np.flatnonzero(state['status'] == STATUS_EXPLORING):
+            drone = self.drones[drone_id]
+            power = state['power'][drone_id]
+            if power <= 0:
+                drone.status = 'dead'
+                logging.error(f"Drone {drone.id} ran out of power at ({drone.x:.1f}, {drone.y:.1f})")
+            elif power < Config.LOW_POWER_THRESHOLD and not drone.low_power_warning_sent:
+                drone.low_power_warning_sent = True
+                logging.warning(f"Drone {drone.id} low on power: {power:.1f}")
+
     def should_update_voronoi(self):
-        
+
         # Check iteration interval
         if self.iteration - self.last_voronoi_update < Config.VORONOI_UPDATE_INTERVAL:
             return False
-        
-        # Check if drone positions changed significantly
-        if self.last_drone_positions is not None:
-            current_positions = [(d.x, d.y) for d in self.drones 
-                               if d.power_remaining > 0 and d.status == 'exploring']
-            
-            if len(current_positions) == len(self.last_drone_positions):
-                max_movement = 0
-                for curr, last in zip(current_positions, self.last_drone_positions):
-                    movement = math.sqrt((curr[0] - last[0])**2 + (curr[1] - last[1])**2)
-                    max_movement = max(max_movement, movement)
-                
-                # Only update if significant movement occurred
-                if max_movement < 3.0:
-                    return False
-        
+
+        # Check if drone positions changed significantly: one vectorized
+        # squared-distance max over the SoA arrays, no sqrt, no lists
+        if self.last_positions_xy is not None:
+            dx = self.state['x'] - self.last_positions_xy[:, 0]
+            dy = self.state['y'] - self.last_positions_xy[:, 1]
+            if (dx * dx + dy * dy).max() < 9.0:
+                return False
+
         return True
 
     def run(self):
         while self.running:
             self.iteration += 1
 
-            # Check for targets
-            for drone in self.drones:
+            # Check for targets — one vectorized test over the whole swarm
+            found_mask, nearest_idx = self.env.detect_batch(
+                self.state['x'], self.state['y'], Config.DETECTION_RADIUS)
+            for drone_id in np.flatnonzero(found_mask):
+                drone = self.drones[drone_id]
                 if drone.status == 'exploring' and drone.power_remaining > 0:
-                    found, target_pos = self.env.getinfo(drone.x, drone.y, drone.detection_radius)
-                    if found and drone.found_target is None:
+                    if drone.found_target is None:
+                        target_pos = self.env.targets[nearest_idx[drone_id]]
                         drone.status = 'halted'
                         drone.found_target = target_pos
-                        self.to_ui.put({
+                        self.to_ui.append({
                             'type': 'target_found',
                             'drone_id': drone.id,
                             'position': (drone.x, drone.y),
@@ -344,49 +540,50 @@ class DroneSimulation:
                         logging.info(f"Drone {drone.id} found target at {target_pos}, power: {drone.power_remaining:.1f}")
 
             # Check for commands from UI
-            try:
-                while not self.to_simulation.empty():
-                    message = self.to_simulation.get_nowait()
-
-                    if message['type'] in ['accept_target', 'discard_target']:
-                        drone_id = message['drone_id']
-                        self.drones[drone_id].status = 'exploring'
-                        self.drones[drone_id].found_target = None
-
-                    elif message['type'] == 'manual_control':
-                        drone_id = message['drone_id']
-                        direction = message['direction']
-                        drone = self.drones[drone_id]
+            while self.to_simulation:
+                message = self.to_simulation.popleft()
+
+                if message['type'] in ['accept_target', 'discard_target']:
+                    drone_id = message['drone_id']
+                    self.drones[drone_id].status = 'exploring'
+                    self.drones[drone_id].found_target = None
+
+                elif message['type'] == 'manual_control':
+                    drone_id = message['drone_id']
+                    direction = message['direction']
+                    drone = self.drones[drone_id]
                         
-                        if drone.power_remaining <= 0:
-                            logging.warning(f"Cannot control Drone {drone_id} - out of power")
-                            continue
+                    if drone.power_remaining <= 0:
+                        logging.warning(f"Cannot control Drone {drone_id} - out of power")
+                        continue
                             
-                        drone.status = 'manual'
-                        speed = Config.MANUAL_SPEED
-
-                        if direction == 'up':
-                            drone.y -= speed
-                        elif direction == 'down':
-                            drone.y += speed
-                        elif direction == 'left':
-                            drone.x -= speed
-                        elif direction == 'right':
-                            drone.x += speed
-
-                        drone.x = max(0, min(self.env.size - 1, drone.x))
-                        drone.y = max(0, min(self.env.size - 1, drone.y))
-            except queue.Empty:
-                pass
+                    drone.status = 'manual'
+                    speed = Config.MANUAL_SPEED
+
+                    if direction == 'up':
+                        drone.y -= speed
+                    elif direction == 'down':
+                        drone.y += speed
+                    elif direction == 'left':
+                        drone.x -= speed
+                    elif direction == 'right':
+                        drone.x += speed
+
+                    drone.x = max(0, min(self.env.size - 1, drone.x))
+                    drone.y = max(0, min(self.env.size - 1, drone.y))
 
             # Update Voronoi assignments periodically
-            unexplored = [r for r in self.all_regions if r not in self.explored_regions]
+            if self._unexplored_dirty:
+                self._unexplored_cache = [r for r in self.all_regions
+                                          if r in self.unexplored_set]
+                self._unexplored_dirty = False
+            unexplored = self._unexplored_cache
             
             if Config.USE_VORONOI and self.should_update_voronoi() and unexplored:
                 self.voronoi_assignments = self.assign_regions_voronoi(unexplored)
                 self.last_voronoi_update = self.iteration
-                self.last_drone_positions = [(d.x, d.y) for d in self.drones 
-                                            if d.power_remaining > 0 and d.status == 'exploring']
+                self.last_positions_xy = np.column_stack(
+                    (self.state['x'], self.state['y']))
                 logging.info(f"Voronoi assignments updated at iteration {self.iteration}")
 
             # Update drones using algorithm
@@ -395,19 +592,20 @@ class DroneSimulation:
                     # Assign region if needed
                     if drone.assigned_region is None:
                         if Config.USE_VORONOI:
-                            # Voronoi-based assignment
-                            my_regions = self.voronoi_assignments.get(drone.id, [])
-                            if my_regions:
-                                # Pick closest from assigned regions
-                                closest_region = min(my_regions,
-                                    key=lambda r: math.sqrt((drone.x - r[0])**2 + (drone.y - r[1])**2))
-                                drone.assigned_region = closest_region
+                            # Voronoi-based assignment: pick the closest of
+                            # this drone's region indices in one argmin
+                            idxs = self.voronoi_assignments.get(drone.id)
+                            if idxs is not None and len(idxs):
+                                ddx = self.region_centers[idxs, 0] - drone.x
+                                ddy = self.region_centers[idxs, 1] - drone.y
+                                best = idxs[np.argmin(ddx * ddx + ddy * ddy)]
+                                drone.assigned_region = self.all_regions[best]
                                 drone.region_explore_time = 0
                         else:
                             # Greedy assignment (original algorithm)
                             if unexplored:
-                                closest_region = min(unexplored, 
-                                    key=lambda r: math.sqrt((drone.x - r[0])**2 + (drone.y - r[1])**2))
+                                closest_region = min(unexplored,
+                                    key=lambda r: (drone.x - r[0])**2 + (drone.y - r[1])**2)
                                 drone.assigned_region = closest_region
                                 drone.region_explore_time = 0
 
@@ -418,32 +616,37 @@ class DroneSimulation:
 
                         if drone.region_explore_time >= self.explore_time_threshold:
                             self.explored_regions.add(drone.assigned_region)
+                            self.unexplored_set.discard(drone.assigned_region)
+                            self._unexplored_dirty = True
                             drone.assigned_region = None
                             logging.debug(f"Drone {drone.id} completed region {drone.assigned_region}")
 
-                    # Apply collision avoidance
-                    drone.avoid_collision(self.drones)
-                    drone.update(self.env.size)
+            # Apply collision avoidance and the batched position/power
+            # update over the whole swarm
+            self.step_physics()
 
             # Send status update periodically
             if self.iteration % Config.UPDATE_INTERVAL == 0:
+                # Both ends live in the same process, so hand the raw pixel
+                # buffer across the queue instead of a PNG encode/decode
+                # round-trip (the single most expensive op in this loop).
                 img = self.env.render(self.drones, self.explored_regions)
-                img_bytes = io.BytesIO()
-                img.save(img_bytes, format='PNG')
-
-                active_drones = sum(1 for d in self.drones if d.power_remaining > 0)
-                
-                self.to_ui.put({
-                    'type': 'status_update',
-                    'iteration': self.iteration,
-                    'image': img_bytes.getvalue(),
-                    'drones': [{'id': d.id, 'x': d.x, 'y': d.y, 'status': d.status, 
-                               'power': d.power_remaining} for d in self.drones],
-                    'explored_regions': len(self.explored_regions),
-                    'total_regions': len(self.all_regions),
-                    'active_drones': active_drones,
-                    'elapsed_time': time.time() - self.start_time
-                })
+
+                active_drones = int((self.state['power'] > 0).sum())
+
+                # Ship copies of the SoA arrays instead of building 20
+                # dicts per update; the UI indexes them as needed.
+                self.to_ui.append(StatusUpdate(
+                    iteration=self.iteration,
+                    image_raw=(img.tobytes(), img.size, img.mode),
+                    drones_arr=(self.state['x'].copy(), self.state['y'].copy(),
+                                self.state['power'].copy(),
+                                self.state['status'].copy()),
+                    explored_regions=len(self.explored_regions),
+                    total_regions=len(self.all_regions),
+                    active_drones=active_drones,
+                    elapsed_time=time.time() - self.start_time,
+                ))
 
             time.sleep(Config.SIMULATION_DELAY)
 
@@ -551,15 +754,13 @@ class CommandCenter:
 
     def update_loop(self):
         try:
-            while not self.simulation.to_ui.empty():
-                message = self.simulation.to_ui.get_nowait()
+            while self.simulation.to_ui:
+                message = self.simulation.to_ui.popleft()
 
-                if message['type'] == 'target_found':
-                    self.handle_target_report(message)
-                elif message['type'] == 'status_update':
+                if isinstance(message, StatusUpdate):
                     self.handle_status_update(message)
-        except queue.Empty:
-            pass
+                elif message['type'] == 'target_found':
+                    self.handle_target_report(message)
         except Exception as e:
             logging.error(f"Error in UI update loop: {e}")
 
@@ -586,19 +787,19 @@ class CommandCenter:
 
     def handle_status_update(self, status):
         try:
-            img_data = status['image']
-            img = Image.open(io.BytesIO(img_data))
+            raw, size, mode = status.image_raw
+            img = Image.frombytes(mode, size, raw)
             img = img.resize((500, 500), Image.LANCZOS)
             self.current_image = ImageTk.PhotoImage(img)
             self.canvas.create_image(0, 0, anchor=tk.NW, image=self.current_image)
         except Exception as e:
             logging.error(f"Error updating image: {e}")
 
-        self.drones_status = status['drones']
-        self.explored_count = status['explored_regions']
-        self.total_regions = status['total_regions']
-        active_drones = status.get('active_drones', 0)
-        elapsed = status.get('elapsed_time', 0)
+        self.drones_status = status.drones_arr
+        self.explored_count = status.explored_regions
+        self.total_regions = status.total_regions
+        active_drones = status.active_drones
+        elapsed = status.elapsed_time
         
         progress = (self.explored_count / self.total_regions * 100) if self.total_regions > 0 else 0
         self.stats_label.config(
@@ -607,7 +808,7 @@ class CommandCenter:
 
     def send_manual_command(self, direction):
         if self.current_manual_drone is not None:
-            self.simulation.to_simulation.put({
+            self.simulation.to_simulation.append({
                 'type': 'manual_control',
                 'drone_id': self.current_manual_drone,
                 'direction': direction
@@ -619,7 +820,7 @@ class CommandCenter:
 
             if report:
                 self.confirmed_targets.append(report)
-                self.simulation.to_simulation.put({
+                self.simulation.to_simulation.append({
                     'type': 'accept_target',
                     'drone_id': self.current_manual_drone
                 })
@@ -631,7 +832,7 @@ class CommandCenter:
 
     def discard_target(self):
         if self.current_manual_drone is not None:
-            self.simulation.to_simulation.put({
+            self.simulation.to_simulation.append({
                 'type': 'discard_target',
                 'drone_id': self.current_manual_drone
             })
@@ -0,0 +1,65 @@
+# Numba-compiled hot-path kernels for the drone swarm simulation.
+#
+# The simulation falls back to its vectorized NumPy path when numba is
+# not installed, so this module must stay importable without it.
+
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    # Deliberately serial: parallel=True's threading runtime can hang
+    # interpreter shutdown when the kernel is first called from a worker
+    # thread, which is how both apps run the simulation. At swarm sizes
+    # of a few dozen drones the serial compiled loop is already far
+    # ahead of the NumPy path and prange had nothing left to win.
+    @njit(fastmath=True, cache=True)
+    def step(xs, ys, vxs, vys, power, moving, env_size,
+             min_dist, avoid_force, power_rate):
+        # One full physics tick: pairwise collision avoidance followed by
+        # the position/bounds/power update. Only drones flagged in
+        # `moving` steer, move and consume power; every drone still
+        # exerts repulsion on its neighbours (same semantics as the
+        # NumPy path in DroneSimulation).
+        n = xs.shape[0]
+        min_d2 = min_dist * min_dist
+
+        for i in range(n):
+            if not moving[i]:
+                continue
+            ax = 0.0
+            ay = 0.0
+            for j in range(n):
+                if j == i:
+                    continue
+                dx = xs[i] - xs[j]
+                dy = ys[i] - ys[j]
+                d2 = dx * dx + dy * dy
+                if 0.0 < d2 < min_d2:
+                    d = math.sqrt(d2)
+                    f = avoid_force / (d + 0.1) / d
+                    ax += dx * f
+                    ay += dy * f
+            vxs[i] += ax
+            vys[i] += ay
+
+        hi = env_size - 1.0
+        for i in range(n):
+            if moving[i]:
+                xs[i] += vxs[i]
+                ys[i] += vys[i]
+                power[i] -= power_rate
+            if xs[i] < 0.0:
+                xs[i] = 0.0
+            elif xs[i] > hi:
+                xs[i] = hi
+            if ys[i] < 0.0:
+                ys[i] = 0.0
+            elif ys[i] > hi:
+                ys[i] = hi